@@ -1,12 +1,19 @@
-from flask import Flask, request, jsonify, send_file
+# Patch the standard library for cooperative I/O before anything imports
+# sockets, so outbound requests made while scraping yield to other requests
+from gevent import monkey
+monkey.patch_all()
+
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
+from flask_compress import Compress
+import orjson
 from dynamicProductScraper import DynamicTradeIndiaScraper
 import os
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
 import io
-import tempfile
+import time
 
 # Load environment variables from .env file
 load_dotenv()
@@ -17,6 +24,7 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
+Compress(app)  # Gzip responses for clients that send Accept-Encoding: gzip
 
 # Initialize scraper
 try:
@@ -26,6 +34,22 @@ except Exception as e:
     logger.error(f"❌ Failed to initialize scraper: {e}")
     scraper = None
 
+# (epoch second, formatted stamp); replaced as a whole so readers never see
+# a half-updated pair
+_timestamp_cache = (0, "")
+
+def request_timestamp():
+    """Return the current time as YYYYmmdd_HHMMSS, formatted at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%Y%m%d_%H%M%S", time.localtime(now)))
+    return _timestamp_cache[1]
+
+def json_response(payload, status=200):
+    """Serialize a (potentially large) payload with orjson."""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -65,10 +89,10 @@ def search_products():
         
         # Add API response metadata
         results["api_version"] = "1.0"
-        results["request_id"] = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results["request_id"] = request_timestamp()
         
         logger.info(f"✅ Search completed for '{product_name}': {results['total_results']} results")
-        return jsonify(results)
+        return json_response(results)
         
     except Exception as e:
         logger.error(f"❌ Error in search endpoint: {e}")
@@ -100,10 +124,10 @@ def search_products_get():
             return jsonify(results), 404
         
         results["api_version"] = "1.0"
-        results["request_id"] = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results["request_id"] = request_timestamp()
         
         logger.info(f"✅ Search completed for '{product_name}': {results['total_results']} results")
-        return jsonify(results)
+        return json_response(results)
         
     except Exception as e:
         logger.error(f"❌ Error in search endpoint: {e}")
@@ -123,7 +147,7 @@ def download_results():
         if not results or not results.get('products'):
             return jsonify({"error": "No results to download"}), 400
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = request_timestamp()
         product_name = results.get('product_name', 'products')
         
         if format_type == 'excel':
@@ -132,15 +156,11 @@ def download_results():
             if not excel_data:
                 return jsonify({"error": "Failed to generate Excel data"}), 500
             
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-                tmp_file.write(excel_data)
-                tmp_file_path = tmp_file.name
-            
             filename = f"tradeindia_{product_name}_{timestamp}.xlsx"
             
+            # Stream straight from memory, no temporary file on disk
             return send_file(
-                tmp_file_path,
+                io.BytesIO(excel_data),
                 as_attachment=True,
                 download_name=filename,
                 mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
@@ -154,13 +174,9 @@ def download_results():
             
             filename = f"tradeindia_{product_name}_{timestamp}.json"
             
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.json', mode='w', encoding='utf-8') as tmp_file:
-                tmp_file.write(json_data)
-                tmp_file_path = tmp_file.name
-            
+            # Stream straight from memory, no temporary file on disk
             return send_file(
-                tmp_file_path,
+                io.BytesIO(json_data.encode('utf-8')),
                 as_attachment=True,
                 download_name=filename,
                 mimetype='application/json'
@@ -172,6 +188,9 @@ def download_results():
         logger.error(f"❌ Error in download endpoint: {e}")
         return jsonify({"error": f"Download failed: {str(e)}"}), 500
 
+# Local development entrypoint only. In production the app is served by
+# gunicorn with gevent workers, e.g.:
+#   gunicorn api_server:app -k gevent -w 4 --worker-connections 100 -b 0.0.0.0:5000
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
@@ -1,17 +1,23 @@
 import requests
 import pandas as pd
+import openpyxl
 from serpapi import GoogleSearch
-from bs4 import BeautifulSoup
-import time
+import lxml.html
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
+from requests.packages.urllib3.util.request import ACCEPT_ENCODING
 from requests.exceptions import SSLError
 import warnings
 import os
 import json
+import io
 from datetime import datetime
 from dotenv import load_dotenv
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from cachetools import TTLCache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,9 +25,139 @@ load_dotenv()
 # Suppress warnings
 warnings.filterwarnings("ignore", category=requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
+# Upper bound on the bytes read from a single product page
+MAX_PAGE_BYTES = 512 * 1024
+
+# Column order of the product records built by extract_product_info
+PRODUCT_COLUMNS = [
+    "Product Name",
+    "Company Name",
+    "Company Link",
+    "Location",
+    "Price (INR)",
+    "Trust Status",
+    "Super Seller",
+    "Established Year",
+    "Business Type",
+    "Product Link",
+    "Scraped At",
+]
+
+# URL/title patterns for DynamicTradeIndiaScraper.is_valid_product_page, each
+# merged into a single alternation compiled once at import time
+_EXCLUDE_PATTERNS = [
+    r'/question-answer/',
+    r'/blog/',
+    r'/us/',
+    r'/city-',
+    r'/products/$',
+    r'/products\?',
+    r'/category/',
+    r'/manufacturers/',
+    r'/suppliers/',
+    r'/seller/$',
+    r'/seller\?',
+    r'\.pdf$',
+    r'\.doc$',
+    r'\.docx$',
+    r'Q\.',
+    r'Question',
+    r'Answer'
+]
+_INCLUDE_PATTERNS = [
+    r'/products/.*\.html$',
+    r'\.tradeindia\.com/.*\.html$',
+    r'/seller/.*\.html$'
+]
+_EXCLUDE_RE = re.compile("(?:" + ")|(?:".join(_EXCLUDE_PATTERNS) + ")", re.IGNORECASE)
+_INCLUDE_RE = re.compile("(?:" + ")|(?:".join(_INCLUDE_PATTERNS) + ")")
+
+def _has_class(name):
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def _compile_field_selector(selectors):
+    """Compile a field's (xpath, required class) fallbacks."""
+    return [(etree.XPath(xpath), required_class) for xpath, required_class in selectors]
+
+class _PageClasses:
+    """Class attribute values of a parsed page, collected in one pass on first use."""
+    
+    def __init__(self, tree):
+        self._tree = tree
+        self._text = None
+    
+    def __contains__(self, class_fragment):
+        if self._text is None:
+            self._text = " ".join(el.get("class", "") for el in self._tree.iter(etree.Element))
+        return class_fragment in self._text
+
 class DynamicTradeIndiaScraper:
-    def __init__(self, api_key=None):
-        """Initialize the scraper with optional API key."""
+    # XPath expressions for each extracted field, compiled once at import and
+    # shared by all instances. Tried in priority order (mirrors the CSS
+    # selector fallbacks used previously). Wildcard (//*) expressions walk
+    # every element, so they are tagged with the class they depend on and
+    # skipped when no element on the page carries it; tag-tested expressions
+    # are cheap and always run.
+    _xp_product_name = _compile_field_selector((
+        (f"//h1[{_has_class('product-title')}]", None),
+        ("//h1", None),
+        (f"//*[{_has_class('product-title')}]", "product-title"),
+        (f"//*[{_has_class('product-name')}]", "product-name"),
+        (f"//h2[{_has_class('product-title')}]", None),
+        (f"//*[{_has_class('product-details')}]//h1", "product-details"),
+        (f"//*[{_has_class('product-info')}]//h1", "product-info"),
+        ("//h1[contains(@class, 'title')]", None),
+        (f"//*[{_has_class('product-header')}]//h1", "product-header"),
+        (f"//*[{_has_class('product-name')}]//h1", "product-name"),
+        (f"//h1[{_has_class('product-name')}]", None),
+    ))
+    _xp_title = etree.XPath("//title")
+    _xp_company = _compile_field_selector((
+        (f"//a[{_has_class('company-url')}]", None),
+        (f"//*[{_has_class('company-name')}]", "company-name"),
+        (f"//*[{_has_class('supplier-name')}]", "supplier-name"),
+        (f"//*[{_has_class('seller-name')}]", "seller-name"),
+        ("//a[contains(@href, '/seller/')]", None),
+        (f"//*[{_has_class('product-supplier')}]", "product-supplier"),
+        (f"//*[{_has_class('company-info')}]//a", "company-info"),
+        (f"//*[{_has_class('supplier-info')}]//a", "supplier-info"),
+        ("//a[contains(@class, 'company')]", None),
+        ("//a[contains(@class, 'supplier')]", None),
+        (f"//*[{_has_class('seller-info')}]//a", "seller-info"),
+        (f"//*[{_has_class('company-details')}]//a", "company-details"),
+    ))
+    _xp_location = _compile_field_selector((
+        (f"//h3[{_has_class('erNFE')}]", None),
+        (f"//*[{_has_class('location')}]", "location"),
+        (f"//*[{_has_class('company-location')}]", "company-location"),
+        (f"//*[{_has_class('supplier-location')}]", "supplier-location"),
+        (f"//*[{_has_class('product-location')}]", "product-location"),
+        ("//*[contains(@class, 'location')]", "location"),
+        (f"//*[{_has_class('address')}]", "address"),
+        (f"//*[{_has_class('company-address')}]", "company-address"),
+        (f"//*[{_has_class('supplier-address')}]", "supplier-address"),
+        (f"//*[{_has_class('location-info')}]", "location-info"),
+        (f"//*[{_has_class('company-location-info')}]", "company-location-info"),
+    ))
+    _xp_price = _compile_field_selector((
+        (f"//span[{_has_class('price-text')}]", None),
+        (f"//*[{_has_class('price')}]", "price"),
+        (f"//*[{_has_class('product-price')}]", "product-price"),
+        (f"//*[{_has_class('price-value')}]", "price-value"),
+        ("//*[contains(@class, 'price')]", "price"),
+        (f"//*[{_has_class('cost')}]", "cost"),
+        (f"//*[{_has_class('product-cost')}]", "product-cost"),
+        (f"//*[{_has_class('price-info')}]", "price-info"),
+        (f"//*[{_has_class('product-price-info')}]", "product-price-info"),
+    ))
+    _xp_trusted = etree.XPath("//img[@alt='Trusted Seller'] | //span[text()='Trusted Seller']")
+    _xp_super_seller = etree.XPath("//img[@alt='Super Seller'] | //span[text()='Super Seller']")
+    _xp_established = etree.XPath("(//span[text()='Established In:'])[1]/following::span[1]")
+    _xp_business_type = etree.XPath(f"(//span[{_has_class('fSXCQo')}])[1]")
+
+    def __init__(self, api_key=None, max_workers=12, cache_ttl=3600, page_cache_ttl=86400):
+        """Initialize the scraper with optional API key, fetch concurrency and cache TTLs (seconds)."""
         self.api_key = api_key or os.getenv('SERPAPI_KEY')
         if not self.api_key:
             raise ValueError(
@@ -30,72 +166,83 @@ class DynamicTradeIndiaScraper:
                 "SERPAPI_KEY=your_api_key_here"
             )
         
-        # Setup requests session with retry strategy
+        # Number of product pages fetched in parallel
+        self.max_workers = max_workers
+        
+        # In-process cache of scrape_product results, keyed on normalized inputs
+        self._results_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._results_cache_lock = threading.Lock()
+        
+        # Per-URL cache of extracted product pages; the same pages show up
+        # across different searches and rarely change within a day
+        self._page_cache = TTLCache(maxsize=10000, ttl=page_cache_ttl)
+        self._page_cache_lock = threading.Lock()
+        
+        # Setup requests session with retry strategy. The pool is shared by all
+        # worker threads so they reuse keep-alive connections to tradeindia.com.
         self.session = requests.Session()
         retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         # Set headers to mimic a real browser
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # gzip/deflate, plus br when the brotli package is installed so
+            # urllib3 can transparently decode Brotli responses
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
 
+    @staticmethod
+    def _select_field(tree, field_selector, page_classes):
+        """Return the first element with text matched by a field's fallbacks, or None."""
+        for xpath, required_class in field_selector:
+            if required_class and required_class not in page_classes:
+                continue
+            elements = xpath(tree)
+            if elements and elements[0].text_content().strip():
+                return elements[0]
+        return None
+
     def is_valid_product_page(self, url, title):
         """Check if the URL and title suggest it's a valid product page."""
-        # Exclude definitely non-product pages
-        exclude_patterns = [
-            r'/question-answer/',
-            r'/blog/',
-            r'/us/',
-            r'/city-',
-            r'/products/$',
-            r'/products\?',
-            r'/category/',
-            r'/manufacturers/',
-            r'/suppliers/',
-            r'/seller/$',
-            r'/seller\?',
-            r'\.pdf$',
-            r'\.doc$',
-            r'\.docx$',
-            r'Q\.',
-            r'Question',
-            r'Answer'
-        ]
-        
-        # Check URL patterns
-        for pattern in exclude_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
-        
-        # Check title patterns
-        for pattern in exclude_patterns:
-            if re.search(pattern, title, re.IGNORECASE):
-                return False
+        # Exclude definitely non-product pages (checked against URL and title)
+        if _EXCLUDE_RE.search(url) or _EXCLUDE_RE.search(title):
+            return False
         
         # Include pages that look like product pages
-        include_patterns = [
-            r'/products/.*\.html$',
-            r'\.tradeindia\.com/.*\.html$',
-            r'/seller/.*\.html$'
-        ]
-        
-        for pattern in include_patterns:
-            if re.search(pattern, url):
-                return True
+        return bool(_INCLUDE_RE.search(url))
+
+    def _run_search_query(self, query):
+        """Run a single SerpAPI Google query and return its organic results."""
+        print(f"🔍 Trying: {query}")
         
-        return False
+        try:
+            params = {
+                "engine": "google",
+                "q": query,
+                "api_key": self.api_key,
+                "num": 10
+            }
+            
+            search = GoogleSearch(params)
+            return search.get_dict().get("organic_results", [])
+            
+        except Exception as e:
+            print(f"   ❌ Error with query '{query}': {e}")
+            return []
 
     def search_product_urls(self, product_name, max_results=50):
         """Search for product URLs using multiple strategies."""
         print(f"🔍 Searching for '{product_name}' products on TradeIndia...")
         
         product_links = []
+        seen_links = set()
         
         # Try different search strategies
         search_queries = [
@@ -106,107 +253,102 @@ class DynamicTradeIndiaScraper:
             f'{product_name} site:tradeindia.com filetype:html'
         ]
         
-        for query in search_queries:
-            print(f"🔍 Trying: {query}")
+        # Issue all queries concurrently; map() keeps results in query order
+        with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+            all_results = list(executor.map(self._run_search_query, search_queries))
+        
+        for query, organic_results in zip(search_queries, all_results):
+            print(f"📄 Results for: {query}")
             
-            try:
-                params = {
-                    "engine": "google",
-                    "q": query,
-                    "api_key": self.api_key,
-                    "num": 10
-                }
-                
-                search = GoogleSearch(params)
-                results = search.get_dict()
-                
-                # Extract product links from search results
-                organic_results = results.get("organic_results", [])
+            if not organic_results:
+                print(f"   ⚠️ No results for this query")
+                continue
+            
+            # Keep valid product pages not already seen, preserving order
+            new_links = 0
+            for result in organic_results:
+                link = result.get("link", "")
+                title = result.get("title", "")
                 
-                if not organic_results:
-                    print(f"   ⚠️ No results for this query")
+                if link in seen_links:
                     continue
                 
-                # Filter for valid product pages
-                valid_links = []
-                for result in organic_results:
-                    link = result.get("link", "")
-                    title = result.get("title", "")
-                    
-                    if "tradeindia.com" in link and self.is_valid_product_page(link, title):
-                        valid_links.append({
-                            "link": link,
-                            "title": title
-                        })
-                
-                print(f"   ✅ Found {len(valid_links)} valid product links")
-                product_links.extend(valid_links)
-                
-                # Remove duplicates while preserving order
-                seen_links = set()
-                unique_links = []
-                for link_info in product_links:
-                    if link_info["link"] not in seen_links:
-                        seen_links.add(link_info["link"])
-                        unique_links.append(link_info)
-                product_links = unique_links
-                
-                if len(product_links) >= max_results:
-                    break
-                
-                time.sleep(1)  # Prevent API rate limiting
-                
-            except Exception as e:
-                print(f"   ❌ Error with query: {e}")
-                continue
+                if "tradeindia.com" in link and self.is_valid_product_page(link, title):
+                    seen_links.add(link)
+                    product_links.append({
+                        "link": link,
+                        "title": title
+                    })
+                    new_links += 1
+            
+            print(f"   ✅ Found {new_links} new valid product links")
+            
+            if len(product_links) >= max_results:
+                break
         
         print(f" Found {len(product_links)} total valid product links")
         return product_links[:max_results]
 
     def extract_product_info(self, url):
         """Extract detailed product information from a TradeIndia product page using requests only."""
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+        if cached is not None:
+            print(f"   ⚡ Cached: {url}")
+            return dict(cached)
+        
         try:
             print(f"   🔍 Fetching: {url}")
             
-            response = self.session.get(url, timeout=15)
+            # Stream the body so non-HTML responses (e.g. a redirect to a PDF)
+            # are dropped before download and oversized pages are truncated.
+            # A fully read body hands its connection back to the pool; on the
+            # early returns and the truncation break the body is left unread,
+            # so closing the response discards that connection instead.
+            with self.session.get(url, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    print(f"   ❌ HTTP {response.status_code}")
+                    return None
+                
+                content_type = response.headers.get("Content-Type", "").lower()
+                if content_type and "html" not in content_type:
+                    print(f"   ⚠️ Skipping non-HTML response ({content_type})")
+                    return None
+                
+                chunks = []
+                total = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= MAX_PAGE_BYTES:
+                        print(f"   ⚠️ Page larger than {MAX_PAGE_BYTES // 1024}KB, truncating")
+                        break
+                content = b"".join(chunks)[:MAX_PAGE_BYTES]
+                
+                # Only force an encoding when the server declared one,
+                # otherwise let lxml honour the <meta> charset
+                encoding = response.encoding if "charset" in content_type else None
             
-            if response.status_code != 200:
-                print(f"   ❌ HTTP {response.status_code}")
-                return None
+            # Parse the raw bytes with lxml
+            tree = lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding=encoding))
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            page_classes = _PageClasses(tree)
             
             # Extract product information
             product_data = {}
             
             # Product Name - try multiple selectors
-            product_name_selectors = [
-                "h1.product-title",
-                "h1",
-                ".product-title",
-                ".product-name",
-                "h2.product-title",
-                ".product-details h1",
-                ".product-info h1",
-                "h1[class*='title']",
-                ".product-header h1",
-                ".product-name h1",
-                "h1.product-name"
-            ]
-            
             product_name = "N/A"
-            for selector in product_name_selectors:
-                element = soup.select_one(selector)
-                if element and element.text.strip():
-                    product_name = element.text.strip()
-                    break
+            element = self._select_field(tree, self._xp_product_name, page_classes)
+            if element is not None:
+                product_name = element.text_content().strip()
             
             # If still N/A, try to extract from URL or page title
             if product_name == "N/A":
                 # Try page title
-                title_tag = soup.find("title")
-                if title_tag and title_tag.text.strip():
-                    title_text = title_tag.text.strip()
+                title_tag = self._xp_title(tree)
+                if title_tag and title_tag[0].text_content().strip():
+                    title_text = title_tag[0].text_content().strip()
                     # Clean up the title
                     if " - " in title_text:
                         product_name = title_text.split(" - ")[0].strip()
@@ -216,106 +358,59 @@ class DynamicTradeIndiaScraper:
             product_data["Product Name"] = product_name
             
             # Company/Supplier Name
-            company_selectors = [
-                "a.company-url",
-                ".company-name",
-                ".supplier-name",
-                ".seller-name",
-                "a[href*='/seller/']",
-                ".product-supplier",
-                ".company-info a",
-                ".supplier-info a",
-                "a[class*='company']",
-                "a[class*='supplier']",
-                ".seller-info a",
-                ".company-details a"
-            ]
-            
             company_name = "N/A"
             company_link = ""
-            for selector in company_selectors:
-                element = soup.select_one(selector)
-                if element and element.text.strip():
-                    company_name = element.text.strip()
-                    company_link = element.get("href", "")
-                    if company_link and not company_link.startswith("http"):
-                        company_link = "https://www.tradeindia.com" + company_link
-                    break
+            element = self._select_field(tree, self._xp_company, page_classes)
+            if element is not None:
+                company_name = element.text_content().strip()
+                company_link = element.get("href", "")
+                if company_link and not company_link.startswith("http"):
+                    company_link = "https://www.tradeindia.com" + company_link
             
             product_data["Company Name"] = company_name
             product_data["Company Link"] = company_link
             
             # Location
-            location_selectors = [
-                "h3.erNFE",
-                ".location",
-                ".company-location",
-                ".supplier-location",
-                ".product-location",
-                "[class*='location']",
-                ".address",
-                ".company-address",
-                ".supplier-address",
-                ".location-info",
-                ".company-location-info"
-            ]
-            
             location = "N/A"
-            for selector in location_selectors:
-                element = soup.select_one(selector)
-                if element and element.text.strip():
-                    location = element.text.strip()
-                    break
+            element = self._select_field(tree, self._xp_location, page_classes)
+            if element is not None:
+                location = element.text_content().strip()
             
             product_data["Location"] = location
             
             # Price
-            price_selectors = [
-                "span.price-text",
-                ".price",
-                ".product-price",
-                ".price-value",
-                "[class*='price']",
-                ".cost",
-                ".product-cost",
-                ".price-info",
-                ".product-price-info"
-            ]
-            
             price = "N/A"
-            for selector in price_selectors:
-                element = soup.select_one(selector)
-                if element and element.text.strip():
-                    price = element.text.strip()
-                    break
+            element = self._select_field(tree, self._xp_price, page_classes)
+            if element is not None:
+                price = element.text_content().strip()
             
             product_data["Price (INR)"] = price
             
             # Trust Status
             trust_status = "Not Trusted"
-            if soup.find("img", alt="Trusted Seller") or soup.find("span", string="Trusted Seller"):
+            if self._xp_trusted(tree):
                 trust_status = "Trusted Seller"
             
             product_data["Trust Status"] = trust_status
             
             # Super Seller Status
             super_seller = "Not Super Seller"
-            if soup.find("img", alt="Super Seller") or soup.find("span", string="Super Seller"):
+            if self._xp_super_seller(tree):
                 super_seller = "Super Seller"
             
             product_data["Super Seller"] = super_seller
             
             # Established Year
-            established = soup.find("span", string="Established In:")
-            if established and established.find_next("span"):
-                product_data["Established Year"] = established.find_next("span").text.strip()
+            established = self._xp_established(tree)
+            if established:
+                product_data["Established Year"] = established[0].text_content().strip()
             else:
                 product_data["Established Year"] = "N/A"
             
             # Business Type
-            business_type = soup.find("span", class_="fSXCQo")
+            business_type = self._xp_business_type(tree)
             if business_type:
-                product_data["Business Type"] = business_type.text.strip()
+                product_data["Business Type"] = business_type[0].text_content().strip()
             else:
                 product_data["Business Type"] = "N/A"
             
@@ -326,7 +421,9 @@ class DynamicTradeIndiaScraper:
             product_data["Scraped At"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             print(f"   ✅ Extracted: {product_name} - {company_name}")
-            return product_data
+            with self._page_cache_lock:
+                self._page_cache[url] = product_data
+            return dict(product_data)
             
         except Exception as e:
             print(f"   ❌ Error extracting from {url}: {e}")
@@ -334,6 +431,15 @@ class DynamicTradeIndiaScraper:
 
     def scrape_product(self, product_name, max_results=30, include_detailed_info=True):
         """Main method to scrape products by name."""
+        cache_key = (product_name.lower().strip(), max_results, include_detailed_info)
+        with self._results_cache_lock:
+            cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            print(f"⚡ Serving cached results for '{product_name}'")
+            # Shallow copy so callers can add response metadata without
+            # touching the cached entry
+            return dict(cached)
+        
         print(f"🚀 Starting dynamic scraping for '{product_name}'...")
         
         # Step 1: Search for product URLs
@@ -342,17 +448,22 @@ class DynamicTradeIndiaScraper:
         if not product_links:
             return {"error": f"No valid product pages found for '{product_name}'"}
         
-        # Step 2: Extract detailed product information
-        all_products = []
+        # Step 2: Extract detailed product information in parallel
+        # (concurrency is bounded by max_workers and the session's pool size)
+        extracted = [None] * len(product_links)
         
-        for i, link_info in enumerate(product_links, 1):
-            print(f" Processing product {i}/{len(product_links)}: {link_info['title']}")
-            
-            product_info = self.extract_product_info(link_info['link'])
-            if product_info:
-                all_products.append(product_info)
-            
-            time.sleep(1)  # Prevent rate limiting
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.extract_product_info, link_info['link']): i
+                for i, link_info in enumerate(product_links)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                print(f" Processed product {done}/{len(product_links)}: {product_links[i]['title']}")
+                extracted[i] = future.result()
+        
+        # Keep search-result order regardless of completion order
+        all_products = [product_info for product_info in extracted if product_info]
         
         # Step 3: Create results
         results = {
@@ -363,15 +474,32 @@ class DynamicTradeIndiaScraper:
         }
         
         print(f"✅ Successfully scraped {len(all_products)} products for '{product_name}'")
-        return results
+        # Don't cache an empty scrape: it usually means every page fetch
+        # failed (rate limiting, outage) and should be retried next time
+        if all_products:
+            with self._results_cache_lock:
+                self._results_cache[cache_key] = results
+        return dict(results)
 
     def generate_excel_data(self, results):
         """Generate Excel data for download."""
         if not results.get("products"):
             return None
         
-        df = pd.DataFrame(results["products"])
-        return df.to_excel(index=False, engine="openpyxl")
+        # Fixed columns skip per-record key inference; missing fields become
+        # empty cells rather than NaN
+        df = pd.DataFrame(results["products"], columns=PRODUCT_COLUMNS).fillna("")
+        
+        # Stream rows through a write-only workbook into an in-memory buffer
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("products")
+        worksheet.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            worksheet.append(row)
+        
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
 
     def generate_json_data(self, results):
         """Generate JSON data for download."""
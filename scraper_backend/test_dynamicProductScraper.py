@@ -0,0 +1,67 @@
+import pytest
+
+from dynamicProductScraper import DynamicTradeIndiaScraper
+
+PLAIN_PAGE = b"""<html><head><title>Plain</title></head><body>
+<h1>Welcome to TradeIndia</h1>
+<div class="some-location">Delhi, India</div>
+<div class="price-box">INR 100</div>
+</body></html>"""
+
+TEMPLATE_PAGE = b"""<html><head><title>Template</title></head><body>
+<h1 class="page-banner">Welcome to TradeIndia</h1>
+<h1 class="product-title">Real Product</h1>
+<div class="some-location">Delhi, India</div>
+<h3 class="erNFE">Mumbai, Maharashtra</h3>
+<div class="price-box">INR 100</div>
+<span class="price-text">INR 250</span>
+</body></html>"""
+
+PAGES = {
+    "https://www.tradeindia.com/products/plain.html": PLAIN_PAGE,
+    "https://www.tradeindia.com/products/template.html": TEMPLATE_PAGE,
+}
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+    encoding = "utf-8"
+
+    def __init__(self, content):
+        self.content = content
+
+    def iter_content(self, chunk_size=1):
+        yield self.content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def make_scraper():
+    scraper = DynamicTradeIndiaScraper(api_key="test")
+    scraper.session.get = lambda url, **kwargs: FakeResponse(PAGES[url])
+    return scraper
+
+
+def extract_fields(scraper, url):
+    product = scraper.extract_product_info(url)
+    product.pop("Scraped At")
+    return product
+
+
+@pytest.mark.parametrize("order", [list(PAGES), list(reversed(PAGES))])
+def test_extraction_does_not_depend_on_page_order(order):
+    scraper = make_scraper()
+    results = {url: extract_fields(scraper, url) for url in order}
+
+    for url in PAGES:
+        assert results[url] == extract_fields(make_scraper(), url)
+
+    template = results["https://www.tradeindia.com/products/template.html"]
+    assert template["Product Name"] == "Real Product"
+    assert template["Location"] == "Mumbai, Maharashtra"
+    assert template["Price (INR)"] == "INR 250"